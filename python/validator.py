@@ -7,8 +7,58 @@ Description: Takes Excel-cleaned data, validates quality, adds enhancements, exp
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import argparse
+import hashlib
 import os
 
+# Use PyArrow's multi-threaded CSV parser when available, else pandas' C parser
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Column dtypes are declared up front so the parser skips inference and
+# low-cardinality dimensions are stored as compact category codes
+CSV_DTYPES = {
+    'Order ID': 'string',
+    'Ship Mode': 'category',
+    'Customer ID': 'string',
+    'Segment': 'category',
+    'Country': 'category',
+    'City': 'category',
+    'State': 'category',
+    'Region': 'category',
+    'Product ID': 'string',
+    'Category': 'category',
+    'Sub-Category': 'category',
+    'Sales': 'float64',
+    'Profit': 'float64',
+    'Discount': 'float64',
+    'Quantity': 'Int32'  # Nullable, so blank cells load and get reported as missing
+}
+
+# Excel-cleaned exports write ISO dates; an explicit format avoids per-value inference
+DATE_COLUMNS = ['Order Date', 'Ship Date']
+DATE_FORMAT = '%Y-%m-%d'
+
+# Upper edges of the right-closed discount bands; the first band also includes 0.
+# Kept float64 to match the Discount column so values like 0.15 bin exactly
+DISCOUNT_BAND_EDGES = np.array([0.15, 0.31, 0.5])
+DISCOUNT_BAND_LABELS = ['0-15%', '16-31%', '32-50%', '50%+']
+
+SALES_TIER_QUANTILES = np.array([0.33, 0.67])
+SALES_TIER_LABELS = ['Low', 'Medium', 'High']
+
+REPORT_PATH = 'data/python_validation_report.txt'
+
+# Columns identifying one product line within an order, used for duplicate detection
+ORDER_LINE_KEY = ['Order ID', 'Product ID', 'Quantity', 'Sales']
+
+MONTH_NAMES = np.array(['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                        'August', 'September', 'October', 'November', 'December'])
+DAY_NAMES = np.array(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+
 class SuperstoreValidator:
     """Data validation and enhancement layer for pre-cleaned sales data"""
     
@@ -22,99 +72,160 @@ class SuperstoreValidator:
         """
         self.input_csv = input_csv
         self.output_csv = output_csv
+        self.fingerprint_path = output_csv + '.fingerprint'
         self.df = None
+        self.date_parse_failures = {}
+        self.profit_ratio = None
+        self.discount_bands = None
         self.validation_report = []
         self.insights_report = []
         
     def load_data(self):
         """Load Excel-cleaned CSV data"""
         print("📂 Loading Excel-cleaned data...")
+        # Cached arrays and report lines belong to the previous frame
+        self.profit_ratio = None
+        self.discount_bands = None
+        self.validation_report = []
+        self.insights_report = []
         try:
             # Try cp1252 first (common Windows encoding), fallback to utf-8
             try:
-                self.df = pd.read_csv(self.input_csv, encoding='cp1252')
+                self.df = pd.read_csv(self.input_csv, encoding='cp1252',
+                                      engine=CSV_ENGINE, dtype=CSV_DTYPES)
             except:
-                self.df = pd.read_csv(self.input_csv, encoding='utf-8')
+                self.df = pd.read_csv(self.input_csv, encoding='utf-8',
+                                      engine=CSV_ENGINE, dtype=CSV_DTYPES)
+            
+            # Parse dates once here and count values that can't be parsed, so
+            # validate_data can report them without re-parsing
+            self.date_parse_failures = {}
+            for col in DATE_COLUMNS:
+                if col in self.df.columns:
+                    raw_dates = self.df[col]
+                    parsed = pd.to_datetime(raw_dates, format=DATE_FORMAT, errors='coerce')
+                    failed = parsed.isna() & raw_dates.notna()
+                    if failed.any():
+                        # Not the Excel-cleaned ISO layout; let pandas infer the format instead
+                        try:
+                            parsed = pd.to_datetime(raw_dates)
+                            failed = parsed.isna() & raw_dates.notna()
+                        except (ValueError, TypeError):
+                            # Count only the values no format can read, but keep the
+                            # original column rather than replacing them with NaT
+                            mixed = pd.to_datetime(raw_dates, format='mixed', errors='coerce')
+                            self.date_parse_failures[col] = (mixed.isna() & raw_dates.notna()).sum()
+                            continue
+                    self.df[col] = parsed
+                    self.date_parse_failures[col] = failed.sum()
+            
             print(f"✅ Loaded {len(self.df):,} rows and {len(self.df.columns)} columns")
             return True
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             return False
     
+    def _check_missing_values(self):
+        """Check 1: Missing values"""
+        missing = self.df.isnull().sum()
+        if missing.any():
+            return f"⚠️  Missing values detected:\n{missing[missing > 0]}", True
+        return "✅ No missing values", False
+    
+    def _check_duplicates(self):
+        """Check 2: Duplicate Order IDs"""
+        if 'Order ID' not in self.df.columns:
+            return None
+        # Note: Same Order ID can appear multiple times for different products,
+        # and Row ID is unique per row, so compare the order-line key instead
+        # of hashing every column
+        if all(col in self.df.columns for col in ORDER_LINE_KEY):
+            duplicates = self.df.duplicated(subset=ORDER_LINE_KEY).sum()
+            if duplicates > 0:
+                return f"⚠️  Found {duplicates} duplicate order lines ({', '.join(ORDER_LINE_KEY)})", True
+            return "✅ No duplicate order lines", False
+        
+        # A partial key would flag every multi-line order, so compare whole rows instead
+        duplicates = self.df.duplicated().sum()
+        if duplicates > 0:
+            return f"⚠️  Found {duplicates} completely duplicate rows", True
+        return "✅ No duplicate rows", False
+    
+    def _check_negative_sales(self, sales):
+        """Check 3: Negative sales values (data integrity issue)"""
+        if sales is None:
+            return None
+        negative_sales = np.count_nonzero(sales < 0)
+        if negative_sales > 0:
+            return f"⚠️  {negative_sales} rows with negative sales (possible data error)", True
+        return "✅ All sales values are non-negative", False
+    
+    def _check_date_format(self):
+        """Check 4: Date format consistency"""
+        if not self.date_parse_failures:
+            return None
+        bad_dates = sum(self.date_parse_failures.values())
+        if bad_dates > 0:
+            return f"⚠️  Date format inconsistencies detected ({bad_dates} unparseable dates)", True
+        return "✅ Date format is consistent", False
+    
+    def _check_discount_range(self, discount):
+        """Check 5: Discount range validation (0 to 1 or 0 to 100)"""
+        if discount is None:
+            return None
+        # Check if discounts are in decimal (0-1) or percentage (0-100) format
+        upper = 100 if np.nanmax(discount) > 1 else 1
+        invalid = np.count_nonzero((discount < 0) | (discount > upper))
+        
+        if invalid > 0:
+            return f"⚠️  {invalid} rows with invalid discount values", True
+        return "✅ All discount values are within valid range", False
+    
+    def _check_extreme_losses(self, sales, profit):
+        """Check 6: Sales-Profit relationship check"""
+        if sales is None or profit is None:
+            return None
+        # Check for extreme profit margins (potential data errors)
+        extreme_loss = np.count_nonzero(self.get_profit_ratio(sales, profit) < -2)
+        if extreme_loss > 0:
+            return f"⚠️  {extreme_loss} rows with extreme losses (>200% negative margin)", True
+        return None
+    
     def validate_data(self):
         """Run comprehensive data quality checks"""
         print("\n🔍 Running data quality validation...")
         
         issues_found = 0
         
-        # Check 1: Missing values
-        missing = self.df.isnull().sum()
-        if missing.any():
-            self.validation_report.append(f"⚠️  Missing values detected:\n{missing[missing > 0]}")
-            issues_found += 1
-        else:
-            self.validation_report.append("✅ No missing values")
-        
-        # Check 2: Duplicate Order IDs
-        if 'Order ID' in self.df.columns:
-            # Note: Same Order ID can appear multiple times for different products
-            # Check for completely duplicate rows instead
-            duplicates = self.df.duplicated().sum()
-            if duplicates > 0:
-                self.validation_report.append(f"⚠️  Found {duplicates} completely duplicate rows")
-                issues_found += 1
-            else:
-                self.validation_report.append("✅ No duplicate rows")
-        
-        # Check 3: Negative sales values (data integrity issue)
-        if 'Sales' in self.df.columns:
-            negative_sales = (self.df['Sales'] < 0).sum()
-            if negative_sales > 0:
-                self.validation_report.append(f"⚠️  {negative_sales} rows with negative sales (possible data error)")
-                issues_found += 1
-            else:
-                self.validation_report.append("✅ All sales values are non-negative")
-        
-        # Check 4: Date format consistency
-        if 'Order Date' in self.df.columns:
-            try:
-                pd.to_datetime(self.df['Order Date'])
-                self.validation_report.append("✅ Date format is consistent")
-            except:
-                self.validation_report.append("⚠️  Date format inconsistencies detected")
-                issues_found += 1
-        
-        # Check 5: Discount range validation (0 to 1 or 0 to 100)
-        if 'Discount' in self.df.columns:
-            max_discount = self.df['Discount'].max()
-            min_discount = self.df['Discount'].min()
-            
-            # Check if discounts are in decimal (0-1) or percentage (0-100) format
-            if max_discount > 1:
-                invalid = ((self.df['Discount'] < 0) | (self.df['Discount'] > 100)).sum()
-            else:
-                invalid = ((self.df['Discount'] < 0) | (self.df['Discount'] > 1)).sum()
-            
-            if invalid > 0:
-                self.validation_report.append(f"⚠️  {invalid} rows with invalid discount values")
-                issues_found += 1
-            else:
-                self.validation_report.append("✅ All discount values are within valid range")
-        
-        # Check 6: Sales-Profit relationship check
-        if 'Sales' in self.df.columns and 'Profit' in self.df.columns:
-            # Check for extreme profit margins (potential data errors)
-            extreme_loss = (self.df['Profit'] / self.df['Sales'] < -2).sum()
-            if extreme_loss > 0:
-                self.validation_report.append(f"⚠️  {extreme_loss} rows with extreme losses (>200% negative margin)")
+        # Pull the numeric columns out once so the range checks below share
+        # the same arrays instead of each rescanning the DataFrame
+        sales = self.df['Sales'].to_numpy() if 'Sales' in self.df.columns else None
+        profit = self.df['Profit'].to_numpy() if 'Profit' in self.df.columns else None
+        discount = self.df['Discount'].to_numpy() if 'Discount' in self.df.columns else None
+        
+        results = [
+            self._check_missing_values(),
+            self._check_duplicates(),
+            self._check_negative_sales(sales),
+            self._check_date_format(),
+            self._check_discount_range(discount),
+            self._check_extreme_losses(sales, profit)
+        ]
+        
+        for result in results:
+            if result is None:
+                continue
+            message, is_issue = result
+            self.validation_report.append(message)
+            if is_issue:
                 issues_found += 1
         
         # Print validation summary
         print("\n" + "="*60)
         print("📋 DATA QUALITY VALIDATION REPORT")
         print("="*60)
-        for item in self.validation_report:
-            print(item)
+        # The same message strings back both the console output and the saved report
+        print("\n".join(self.validation_report))
         print("="*60)
         
         if issues_found == 0:
@@ -124,6 +235,37 @@ class SuperstoreValidator:
         
         return issues_found == 0
     
+    def get_profit_ratio(self, sales=None, profit=None):
+        """
+        Profit / Sales per row, computed once and shared by validation and enhancement
+        
+        Args:
+            sales: Sales array already extracted by the caller (default: read from self.df)
+            profit: Profit array already extracted by the caller (default: read from self.df)
+        """
+        if self.profit_ratio is None:
+            if sales is None:
+                sales = self.df['Sales'].to_numpy()
+            if profit is None:
+                profit = self.df['Profit'].to_numpy()
+            # Zero-sales rows get a 0 ratio instead of dividing into infinity
+            ratio = np.zeros_like(sales)
+            np.divide(profit, sales, out=ratio, where=sales != 0)
+            self.profit_ratio = ratio
+        
+        return self.profit_ratio
+    
+    def get_discount_bands(self):
+        """Bin discounts into bands, computing once and reusing the cached result"""
+        if self.discount_bands is None:
+            discount = self.df['Discount'].to_numpy()
+            codes = np.searchsorted(DISCOUNT_BAND_EDGES, discount, side='left')
+            # Negative, >100% and missing discounts belong to no band
+            codes[~((discount >= 0) & (discount <= 1))] = -1
+            self.discount_bands = pd.Categorical.from_codes(codes, categories=DISCOUNT_BAND_LABELS)
+        
+        return self.discount_bands
+    
     def enhance_data(self):
         """Add calculated fields and enhancements"""
         print("\n🔧 Enhancing data with calculated fields...")
@@ -131,58 +273,67 @@ class SuperstoreValidator:
         enhancements_added = []
         
         # Enhancement 1: Time dimensions (if not already present)
-        if 'Order Date' in self.df.columns:
-            self.df['Order Date'] = pd.to_datetime(self.df['Order Date'])
+        if 'Order Date' in self.df.columns and pd.api.types.is_datetime64_any_dtype(self.df['Order Date']):
+            time_columns = [c for c in ['Year', 'Month', 'Quarter', 'Day of Week', 'Month Name']
+                            if c not in self.df.columns]
             
-            if 'Year' not in self.df.columns:
-                self.df['Year'] = self.df['Order Date'].dt.year
-                enhancements_added.append("Year")
-            
-            if 'Month' not in self.df.columns:
-                self.df['Month'] = self.df['Order Date'].dt.month
-                enhancements_added.append("Month")
-            
-            if 'Quarter' not in self.df.columns:
-                self.df['Quarter'] = self.df['Order Date'].dt.quarter
-                enhancements_added.append("Quarter")
-            
-            if 'Day of Week' not in self.df.columns:
-                self.df['Day of Week'] = self.df['Order Date'].dt.day_name()
-                enhancements_added.append("Day of Week")
-            
-            if 'Month Name' not in self.df.columns:
-                self.df['Month Name'] = self.df['Order Date'].dt.month_name()
-                enhancements_added.append("Month Name")
+            if time_columns:
+                # Derive every part from one day-resolution array instead of
+                # decoding the datetime column once per .dt accessor
+                days = self.df['Order Date'].to_numpy().astype('datetime64[D]')
+                month_index = days.astype('datetime64[M]').astype(np.int64)
+                months = month_index % 12 + 1
+                weekdays = (days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+                
+                time_parts = pd.DataFrame({
+                    'Year': month_index // 12 + 1970,
+                    'Month': months,
+                    'Quarter': (months - 1) // 3 + 1,
+                    'Day of Week': DAY_NAMES[weekdays],
+                    'Month Name': MONTH_NAMES[months - 1]
+                }, index=self.df.index)[time_columns]
+                
+                # NaT has no calendar parts, so unparsed dates stay missing
+                missing_dates = np.isnat(days)
+                if missing_dates.any():
+                    time_parts = time_parts.mask(pd.Series(missing_dates, index=self.df.index), axis=0)
+                
+                self.df = self.df.assign(**time_parts)
+                enhancements_added.extend(time_columns)
+        elif 'Order Date' in self.df.columns:
+            print("⚠️  Skipped time dimensions: Order Date has unparseable values (see validation report)")
         
         # Enhancement 2: Profit Margin percentage
         if 'Sales' in self.df.columns and 'Profit' in self.df.columns:
             if 'Profit Margin' not in self.df.columns:
-                self.df['Profit Margin'] = (self.df['Profit'] / self.df['Sales'] * 100).round(2)
-                # Handle division by zero or infinity
-                self.df['Profit Margin'] = self.df['Profit Margin'].replace([np.inf, -np.inf], 0)
+                # Full precision is kept for the downstream means; rounding happens on export
+                self.df['Profit Margin'] = self.get_profit_ratio() * 100
                 enhancements_added.append("Profit Margin (%)")
         
         # Enhancement 3: Discount Band categorization
         if 'Discount' in self.df.columns:
             if 'Discount Band' not in self.df.columns:
-                self.df['Discount Band'] = pd.cut(
-                    self.df['Discount'], 
-                    bins=[0, 0.15, 0.31, 0.5, 1.0],
-                    labels=['0-15%', '16-31%', '32-50%', '50%+'],
-                    include_lowest=True
-                )
+                self.df['Discount Band'] = self.get_discount_bands()
                 enhancements_added.append("Discount Band")
         
         # Enhancement 4: Sales Tier
         if 'Sales' in self.df.columns:
             if 'Sales Tier' not in self.df.columns:
-                sales_quantiles = self.df['Sales'].quantile([0.33, 0.67])
-                self.df['Sales Tier'] = pd.cut(
-                    self.df['Sales'],
-                    bins=[0, sales_quantiles[0.33], sales_quantiles[0.67], self.df['Sales'].max()],
-                    labels=['Low', 'Medium', 'High'],
-                    include_lowest=True
-                )
+                sales = self.df['Sales'].to_numpy()
+                valid_sales = sales[~np.isnan(sales)]
+                
+                # 33rd/67th percentiles (linear, as Series.quantile) from an O(n)
+                # partition around the neighbouring ranks instead of a full sort
+                positions = (valid_sales.size - 1) * SALES_TIER_QUANTILES
+                lower = np.floor(positions).astype(np.intp)
+                upper = np.ceil(positions).astype(np.intp)
+                ranked = np.partition(valid_sales, np.concatenate([lower, upper]))
+                thresholds = ranked[lower] + (ranked[upper] - ranked[lower]) * (positions - lower)
+                
+                # Right-closed tiers from 0; negative or missing sales get no tier
+                codes = np.searchsorted(thresholds, sales, side='left')
+                codes[~(sales >= 0)] = -1
+                self.df['Sales Tier'] = pd.Categorical.from_codes(codes, categories=SALES_TIER_LABELS)
                 enhancements_added.append("Sales Tier")
         
         if enhancements_added:
@@ -194,85 +345,95 @@ class SuperstoreValidator:
         
         return enhancements_added
     
+    def _report_insight(self, title, lines):
+        """Print an insight block and record it for the saved report"""
+        lines = list(lines)
+        print(title)
+        if lines:
+            print("\n".join(lines))
+        self.insights_report.append(title)
+        self.insights_report.extend(lines)
+    
     def generate_insights(self):
         """Generate automated business insights"""
         print("\n📊 GENERATING AUTOMATED BUSINESS INSIGHTS")
         print("="*60)
         
-        # Insight 1: Top loss-making sub-categories
+        # Sub-Category totals feed both insight 1 and insight 5, so aggregate once
+        subcat_totals = None
         if 'Sub-Category' in self.df.columns and 'Profit' in self.df.columns:
-            loss_makers = self.df.groupby('Sub-Category')['Profit'].sum().sort_values().head(3)
-            print("\n🔴 Top 3 Loss-Making Sub-Categories:")
-            self.insights_report.append("\n🔴 Top 3 Loss-Making Sub-Categories:")
-            for cat, loss in loss_makers.items():
-                line = f"   • {cat}: ${loss:,.2f}"
-                print(line)
-                self.insights_report.append(line)
+            # Sum straight over the categorical codes with np.bincount rather than
+            # a hash-based groupby; missing sub-categories (code -1) are dropped
+            sub_category = self.df['Sub-Category'].astype('category')
+            codes = sub_category.cat.codes.to_numpy()
+            observed = codes >= 0
+            codes = codes[observed]
+            n_categories = len(sub_category.cat.categories)
+            
+            def sum_by_code(column):
+                # NaNs are skipped, as in groupby().sum()
+                values = np.nan_to_num(self.df[column].to_numpy(dtype=np.float64, na_value=np.nan)[observed])
+                return np.bincount(codes, weights=values, minlength=n_categories)
+            
+            totals = {'Profit': sum_by_code('Profit')}
+            if 'Quantity' in self.df.columns:
+                totals['Quantity'] = sum_by_code('Quantity').astype(np.int64)
+            subcat_totals = pd.DataFrame(totals, index=sub_category.cat.categories.rename('Sub-Category'))
+            # Keep only sub-categories that actually occur, like observed=True
+            subcat_totals = subcat_totals[np.bincount(codes, minlength=n_categories) > 0]
+        
+        # Insight 1: Top loss-making sub-categories
+        if subcat_totals is not None:
+            loss_makers = subcat_totals['Profit'].nsmallest(3)
+            lines = "   • " + loss_makers.index.astype(str) + ": $" + loss_makers.map("{:,.2f}".format)
+            self._report_insight("\n🔴 Top 3 Loss-Making Sub-Categories:", lines)
         
         # Insight 2: Discount impact on profitability
         if 'Discount' in self.df.columns and 'Profit Margin' in self.df.columns:
-            discount_bins = pd.cut(
-                self.df['Discount'], 
-                bins=[0, 0.15, 0.31, 0.5, 1.0],
-                labels=['0-15%', '16-31%', '32-50%', '50%+'],
-                include_lowest=True
-            )
+            discount_bins = self.get_discount_bands()
             margin_by_discount = self.df.groupby(discount_bins, observed=True)['Profit Margin'].mean()
             
-            print("\n📉 Average Profit Margin by Discount Level:")
-            self.insights_report.append("\n📉 Average Profit Margin by Discount Level:")
-            for level, margin in margin_by_discount.items():
-                status = "✅" if margin > 0 else "❌"
-                line = f"   {status} {level}: {margin:.2f}%"
-                print(line)
-                self.insights_report.append(line)
+            lines = [f"   {'✅' if margin > 0 else '❌'} {level}: {margin:.2f}%"
+                     for level, margin in zip(margin_by_discount.index, margin_by_discount.to_numpy())]
+            self._report_insight("\n📉 Average Profit Margin by Discount Level:", lines)
         
         # Insight 3: Regional performance
         if 'Region' in self.df.columns:
-            regional_perf = self.df.groupby('Region').agg({
+            regional_perf = self.df.groupby('Region', observed=True).agg({
                 'Sales': 'sum',
                 'Profit': 'sum'
             }).sort_values('Profit', ascending=False)
             
-            print("\n🌎 Regional Performance (ranked by profit):")
-            self.insights_report.append("\n🌎 Regional Performance (ranked by profit):")
-            for region, row in regional_perf.iterrows():
-                line = f"   • {region}: Sales ${row['Sales']:,.0f} | Profit ${row['Profit']:,.0f}"
-                print(line)
-                self.insights_report.append(line)
+            lines = ("   • " + regional_perf.index.astype(str) +
+                     ": Sales $" + regional_perf['Sales'].map("{:,.0f}".format) +
+                     " | Profit $" + regional_perf['Profit'].map("{:,.0f}".format))
+            self._report_insight("\n🌎 Regional Performance (ranked by profit):", lines)
         
         # Insight 4: Category profitability
         if 'Category' in self.df.columns:
-            category_perf = self.df.groupby('Category').agg({
+            category_perf = self.df.groupby('Category', observed=True).agg({
                 'Sales': 'sum',
                 'Profit': 'sum',
                 'Profit Margin': 'mean'
             }).sort_values('Profit', ascending=False)
             
-            print("\n📦 Category Performance:")
-            self.insights_report.append("\n📦 Category Performance:")
-            for category, row in category_perf.iterrows():
-                line = f"   • {category}: Sales ${row['Sales']:,.0f} | Profit ${row['Profit']:,.0f} | Avg Margin {row['Profit Margin']:.2f}%"
-                print(line)
-                self.insights_report.append(line)
+            lines = ("   • " + category_perf.index.astype(str) +
+                     ": Sales $" + category_perf['Sales'].map("{:,.0f}".format) +
+                     " | Profit $" + category_perf['Profit'].map("{:,.0f}".format) +
+                     " | Avg Margin " + category_perf['Profit Margin'].map("{:.2f}%".format))
+            self._report_insight("\n📦 Category Performance:", lines)
         
         # Insight 5: High-volume, low-profit products (red flag)
-        if 'Sub-Category' in self.df.columns and 'Quantity' in self.df.columns:
-            subcat_analysis = self.df.groupby('Sub-Category').agg({
-                'Quantity': 'sum',
-                'Profit': 'sum'
-            })
+        if subcat_totals is not None and 'Quantity' in subcat_totals.columns:
             # Find high-volume but negative profit sub-categories
-            red_flags = subcat_analysis[(subcat_analysis['Quantity'] > subcat_analysis['Quantity'].quantile(0.5)) & 
-                                       (subcat_analysis['Profit'] < 0)]
+            red_flags = subcat_totals[(subcat_totals['Quantity'] > subcat_totals['Quantity'].quantile(0.5)) & 
+                                      (subcat_totals['Profit'] < 0)]
             
             if not red_flags.empty:
-                print("\n⚠️  High-Volume but Loss-Making Sub-Categories:")
-                self.insights_report.append("\n⚠️  High-Volume but Loss-Making Sub-Categories:")
-                for subcat, row in red_flags.iterrows():
-                    line = f"   • {subcat}: {int(row['Quantity'])} units sold but ${row['Profit']:,.2f} loss"
-                    print(line)
-                    self.insights_report.append(line)
+                lines = ("   • " + red_flags.index.astype(str) +
+                         ": " + red_flags['Quantity'].astype(int).astype(str) +
+                         " units sold but $" + red_flags['Profit'].map("{:,.2f}".format) + " loss")
+                self._report_insight("\n⚠️  High-Volume but Loss-Making Sub-Categories:", lines)
         
         print("="*60)
     
@@ -286,8 +447,13 @@ class SuperstoreValidator:
             if output_dir and output_dir != '':
                 os.makedirs(output_dir, exist_ok=True)
             
-            # Export to CSV
-            self.df.to_csv(self.output_csv, index=False, encoding='utf-8')
+            # Profit Margin is only rounded to 2 decimals for the exported file
+            export_df = self.df
+            if 'Profit Margin' in export_df.columns:
+                export_df = export_df.assign(**{'Profit Margin': export_df['Profit Margin'].round(2)})
+            
+            # Export to CSV, formatting and writing in bounded row chunks
+            export_df.to_csv(self.output_csv, index=False, encoding='utf-8', chunksize=50_000)
             
             # Get file info
             file_size = os.path.getsize(self.output_csv) / 1024  # KB
@@ -303,47 +469,48 @@ class SuperstoreValidator:
     
     def save_report(self):
         """Save validation and insights to text report"""
-        report_path = 'data/python_validation_report.txt'
+        report_path = REPORT_PATH
         
         try:
             # Create data directory if it doesn't exist
             os.makedirs(os.path.dirname(report_path), exist_ok=True)
             
+            rule = "=" * 70
+            validation_lines = "".join(item + "\n" for item in self.validation_report)
+            insight_lines = "".join(item + "\n" for item in self.insights_report)
+            
+            # Assemble the whole report in memory and write it in one call
+            report = (
+                f"{rule}\n"
+                "SUPERSTORE DATA VALIDATION & INSIGHTS REPORT\n"
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"{rule}\n\n"
+                "INPUT FILE:\n"
+                f"  {self.input_csv}\n\n"
+                "OUTPUT FILE:\n"
+                f"  {self.output_csv}\n\n"
+                "DATA SUMMARY:\n"
+                f"  Total rows: {len(self.df):,}\n"
+                f"  Total columns: {len(self.df.columns)}\n\n"
+                f"{rule}\n"
+                "VALIDATION RESULTS\n"
+                f"{rule}\n"
+                f"{validation_lines}"
+                f"\n{rule}\n"
+                "AUTOMATED BUSINESS INSIGHTS\n"
+                f"{rule}\n"
+                f"{insight_lines}"
+                f"\n{rule}\n"
+                "NEXT STEPS:\n"
+                f"{rule}\n"
+                "1. Review this validation report\n"
+                "2. Import the final CSV into SQLite using your existing SQL scripts\n"
+                "3. Refresh your Power BI dashboard\n"
+                f"{rule}\n"
+            )
+            
             with open(report_path, 'w', encoding='utf-8') as f:
-                f.write("="*70 + "\n")
-                f.write("SUPERSTORE DATA VALIDATION & INSIGHTS REPORT\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("="*70 + "\n\n")
-                
-                f.write("INPUT FILE:\n")
-                f.write(f"  {self.input_csv}\n\n")
-                
-                f.write("OUTPUT FILE:\n")
-                f.write(f"  {self.output_csv}\n\n")
-                
-                f.write("DATA SUMMARY:\n")
-                f.write(f"  Total rows: {len(self.df):,}\n")
-                f.write(f"  Total columns: {len(self.df.columns)}\n\n")
-                
-                f.write("="*70 + "\n")
-                f.write("VALIDATION RESULTS\n")
-                f.write("="*70 + "\n")
-                for item in self.validation_report:
-                    f.write(item + "\n")
-                
-                f.write("\n" + "="*70 + "\n")
-                f.write("AUTOMATED BUSINESS INSIGHTS\n")
-                f.write("="*70 + "\n")
-                for item in self.insights_report:
-                    f.write(item + "\n")
-                
-                f.write("\n" + "="*70 + "\n")
-                f.write("NEXT STEPS:\n")
-                f.write("="*70 + "\n")
-                f.write("1. Review this validation report\n")
-                f.write("2. Import the final CSV into SQLite using your existing SQL scripts\n")
-                f.write("3. Refresh your Power BI dashboard\n")
-                f.write("="*70 + "\n")
+                f.write(report)
             
             print(f"✅ Validation report saved: {report_path}")
             return True
@@ -352,8 +519,47 @@ class SuperstoreValidator:
             print(f"❌ Error saving report: {e}")
             return False
     
-    def run(self):
-        """Execute the validation and enhancement pipeline"""
+    def compute_fingerprint(self):
+        """Hash the input CSV together with this script, or None if either can't be read"""
+        # Including the script means code changes also invalidate a previous export
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            for path in (self.input_csv, __file__):
+                with open(path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+    
+    def is_up_to_date(self, fingerprint):
+        """Check whether the existing export and report were produced from the same input"""
+        if fingerprint is None or not os.path.exists(self.output_csv) or not os.path.exists(REPORT_PATH):
+            return False
+        try:
+            with open(self.fingerprint_path, 'r', encoding='utf-8') as f:
+                return f.read().strip() == fingerprint
+        except OSError:
+            return False
+    
+    def save_fingerprint(self, fingerprint):
+        """Store the input fingerprint next to the exported CSV"""
+        try:
+            with open(self.fingerprint_path, 'w', encoding='utf-8') as f:
+                f.write(fingerprint)
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error saving fingerprint: {e}")
+            return False
+    
+    def run(self, force=False):
+        """
+        Execute the validation and enhancement pipeline
+        
+        Args:
+            force: Re-run even if the input is unchanged since the last export
+        """
         print("="*70)
         print("🚀 SUPERSTORE DATA VALIDATOR - STARTING")
         print("="*70)
@@ -361,6 +567,13 @@ class SuperstoreValidator:
         print(f"Output: {self.output_csv}")
         print("="*70 + "\n")
         
+        # Skip the whole pipeline when the last export came from identical input
+        fingerprint = self.compute_fingerprint()
+        if not force and self.is_up_to_date(fingerprint):
+            print("⏭️  Input unchanged since last export - skipping (use --force to re-run)")
+            print(f"📁 Final cleaned CSV: {self.output_csv}")
+            return True
+        
         # Step 1: Load Excel-cleaned data
         if not self.load_data():
             return False
@@ -379,13 +592,18 @@ class SuperstoreValidator:
             return False
         
         # Step 6: Save report
-        self.save_report()
+        report_saved = self.save_report()
+        
+        # Step 7: Record the input fingerprint so unchanged re-runs can be skipped,
+        # but only once the report exists too, otherwise it would never be regenerated
+        if report_saved and fingerprint is not None:
+            self.save_fingerprint(fingerprint)
         
         print("\n" + "="*70)
         print("✅ VALIDATION COMPLETE!")
         print("="*70)
         print(f"\n📁 Final cleaned CSV: {self.output_csv}")
-        print("📁 Validation report: data/python_validation_report.txt")
+        print(f"📁 Validation report: {REPORT_PATH}")
         print("\n📋 NEXT STEPS:")
         print("   1. Review the validation report")
         print("   2. Load final CSV into SQLite (your existing process)")
@@ -404,9 +622,14 @@ if __name__ == "__main__":
     INPUT_FILE = "data/Superstore Cleaned.csv"          # Excel-cleaned input
     OUTPUT_FILE = "data/Superstore_Final_Cleaned.csv"   # Python-validated output
     
+    parser = argparse.ArgumentParser(description="Validate and enhance the Excel-cleaned Superstore data")
+    parser.add_argument('--force', action='store_true',
+                        help="re-run even if the input is unchanged since the last export")
+    args = parser.parse_args()
+    
     # Run the validator
     validator = SuperstoreValidator(INPUT_FILE, OUTPUT_FILE)
-    success = validator.run()
+    success = validator.run(force=args.force)
     
     if success:
         print("✨ Ready for SQL ingestion!")